@@ -5,9 +5,11 @@ Copyright (c) 2025 Arjun-M/SwiftBot
 
 
 import asyncio
+import copy
+import time
 from typing import Optional, Dict, List, Callable, Any
 from .router import CommandRouter
-from .context import Context
+from .context import Context, MemoryStorage, StoragePool
 from .connection.pool import HTTPConnectionPool
 from .connection.worker import WorkerPool
 from .api.telegram import TelegramAPI
@@ -27,7 +29,7 @@ class SwiftBot:
     SwiftBot - Ultra-fast Telegram bot framework with enhanced error handling.
 
     Features:
-    - 30× faster command routing with Trie data structure
+    - 30× faster command routing with indexed command lookup
     - HTTP/2 connection pooling for maximum throughput
     - Worker pool for concurrent update processing
     - Telethon-inspired decorator syntax
@@ -64,6 +66,7 @@ class SwiftBot:
         rate_limiter: Optional[Dict] = None,
         debug: bool = False,
         enable_centralized_exceptions: bool = True,
+        max_data_entries: Optional[int] = None,
     ):
         """
         Initialize SwiftBot client.
@@ -82,6 +85,8 @@ class SwiftBot:
             rate_limiter: Rate limiter configuration
             debug: Enable debug mode (handled by middleware)
             enable_centralized_exceptions: Enable centralized exception handling
+            max_data_entries: Maximum users (and chats) with stored data kept in memory;
+                least recently active entries are dropped beyond it (None = unlimited)
         """
         # Validate token
         if not token or not isinstance(token, str):
@@ -140,10 +145,19 @@ class SwiftBot:
         self.running = False
         self._update_offset = 0
 
+        # Per-user and per-chat data pools, shared by every update from the same user/chat.
+        # Only storages holding data are kept; max_data_entries optionally caps each pool.
+        self._user_data_pool = StoragePool(max_data_entries)
+        self._chat_data_pool = StoragePool(max_data_entries)
+
         # Bot info cache with TTL
         self._bot_info = None
         self._bot_info_expires = 0
 
+        # Pool/router stats snapshot cache: (monotonic time, snapshots)
+        self._stats_cache = (0.0, None)
+        self._stats_cache_ttl = 1.0
+
         # Statistics
         self._stats = {
             'updates_processed': 0,
@@ -173,6 +187,7 @@ class SwiftBot:
         def decorator(func: Callable):
             try:
                 self.router.add_handler(event_type, func, priority)
+                self._stats_cache = (0.0, None)  # Router stats changed
                 return func
             except Exception as e:
                 if self.exception_handler:
@@ -223,6 +238,30 @@ class SwiftBot:
                 self.exception_handler.handle_exception(e, context="get_me")
             raise SwiftBotError(f"Failed to get bot info: {e}")
 
+    def _get_user_data(self, user_id: int) -> MemoryStorage:
+        """
+        Get pooled user data storage, reusing it across updates.
+
+        Args:
+            user_id: Telegram user ID
+
+        Returns:
+            MemoryStorage for this user
+        """
+        return self._user_data_pool.get_storage(user_id)
+
+    def _get_chat_data(self, chat_id: int) -> MemoryStorage:
+        """
+        Get pooled chat data storage, reusing it across updates.
+
+        Args:
+            chat_id: Telegram chat ID
+
+        Returns:
+            MemoryStorage for this chat
+        """
+        return self._chat_data_pool.get_storage(chat_id)
+
     async def _handle_exception(self, exception: Exception, context: str = "unknown"):
         """Handle exceptions through centralized handler"""
         if self.exception_handler:
@@ -363,7 +402,11 @@ class SwiftBot:
             # Drop pending updates if requested
             if drop_pending_updates:
                 try:
-                    await self.api.get_updates(offset=-1)
+                    # offset=-1 returns only the newest update; skip past it so
+                    # the backlog is confirmed and nothing queued gets processed
+                    pending = await self.api.get_updates(offset=-1, timeout=0)
+                    if pending:
+                        self._update_offset = pending[-1].get('update_id', 0) + 1
                 except Exception as e:
                     await self._handle_exception(e, "drop_pending_updates")
 
@@ -514,10 +557,24 @@ class SwiftBot:
     def get_stats(self) -> Dict:
         """
         Get bot statistics with enhanced metrics.
+        Worker pool, connection pool and router snapshots are cached for one second
+        to absorb bursts of calls; counters and running state are always live.
 
         Returns:
             Dictionary with statistics
         """
+        now = time.monotonic()
+        cached_at, snapshots = self._stats_cache
+        if snapshots is None or now - cached_at >= self._stats_cache_ttl:
+            snapshots = (
+                self.worker_pool.get_stats() if hasattr(self.worker_pool, 'get_stats') else {},
+                self.connection_pool.get_stats() if hasattr(self.connection_pool, 'get_stats') else {},
+                self.router.get_stats(),
+            )
+            self._stats_cache = (now, snapshots)
+        # Deep copy so callers never share nested dicts/lists with the cache
+        worker_pool_stats, connection_pool_stats, router_stats = copy.deepcopy(snapshots)
+
         current_time = asyncio.get_event_loop().time()
         uptime = current_time - self._stats['start_time'] if self._stats['start_time'] else 0
 
@@ -528,12 +585,13 @@ class SwiftBot:
             "errors_handled": self._stats['errors_handled'],
             "handlers_executed": self._stats['handlers_executed'],
             "exceptions_by_type": self._stats['exceptions_by_type'],
-            "worker_pool": self.worker_pool.get_stats() if hasattr(self.worker_pool, 'get_stats') else {},
-            "connection_pool": self.connection_pool.get_stats() if hasattr(self.connection_pool, 'get_stats') else {},
-            "router": self.router.get_stats(),
+            "worker_pool": worker_pool_stats,
+            "connection_pool": connection_pool_stats,
+            "router": router_stats,
+            "router_total": self.router.total_handlers,
             "middleware_count": len(self.middleware),
             "bot_info_cached": self._bot_info is not None,
-        }      
+        }
 
     # ===========================================
     # TELEGRAM API FORWARDING METHODS
@@ -4,6 +4,7 @@ Copyright (c) 2025 Arjun-M/SwiftBot
 """
 
 from typing import Optional, Any, Dict, List
+from collections import OrderedDict
 import re
 import logging
 from .update_types import Update, Message as MessageType, User, Chat
@@ -11,17 +12,62 @@ from .update_types import Update, Message as MessageType, User, Chat
 logger = logging.getLogger(__name__)
 
 class MemoryStorage:
-    def __init__(self):
+    def __init__(self, pool: Optional["StoragePool"] = None, pool_key: Any = None):
         self.data = {}
+        # Owning pool; the storage only joins it once it holds data
+        self._pool = pool
+        self._pool_key = pool_key
 
     async def set(self, key, value):
         self.data[key] = value
+        if self._pool is not None:
+            self._pool._retain(self._pool_key, self)
 
     async def get(self, key):
         return self.data.get(key)
 
     async def delete(self, key):
         self.data.pop(key, None)
+        if not self.data and self._pool is not None:
+            self._pool._release(self._pool_key, self)
+
+
+class StoragePool(OrderedDict):
+    """
+    Per-user or per-chat MemoryStorage pool, kept in last-activity order.
+    Only storages holding data are retained, so users and chats that never
+    write anything cost nothing after their update is handled.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        super().__init__()
+        self.max_entries = max_entries
+
+    def get_storage(self, key: Any) -> MemoryStorage:
+        """Get the pooled storage for key, or a fresh one that joins on first write"""
+        storage = self.get(key)
+        if storage is None:
+            return MemoryStorage(self, key)
+        self.move_to_end(key)
+        return storage
+
+    def _retain(self, key: Any, storage: MemoryStorage):
+        """Keep storage after a write, sharing data with any storage already pooled for key"""
+        pooled = self.get(key)
+        if pooled is None:
+            self[key] = storage
+            if self.max_entries is not None and len(self) > self.max_entries:
+                self.popitem(last=False)
+        elif pooled.data is not storage.data:
+            # Concurrent updates for the same key: merge into the pooled dict
+            pooled.data.update(storage.data)
+            storage.data = pooled.data
+
+    def _release(self, key: Any, storage: MemoryStorage):
+        """Drop the pooled entry once its data has been emptied"""
+        pooled = self.get(key)
+        if pooled is not None and pooled.data is storage.data:
+            del self[key]
 
 class Context:
     """
@@ -100,8 +146,9 @@ class Context:
         # Middleware data storage
         self.middleware_data: Dict[str, Any] = {}
 
-        self.user_data = MemoryStorage()
-        self.chat_data = MemoryStorage()
+        # User and chat data are pooled on the bot so they survive across updates
+        self.user_data = bot._get_user_data(self.user.id) if self.user else MemoryStorage()
+        self.chat_data = bot._get_chat_data(self.chat.id) if self.chat else MemoryStorage()
         self.state = None
 
     def _extract_common_fields(self, update_obj):
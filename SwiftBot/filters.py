@@ -7,6 +7,7 @@ import re
 import logging
 from typing import Union, List, Callable, Optional, Any
 from functools import wraps
+from .utils import _compile_re
 
 logger = logging.getLogger(__name__)
 
@@ -33,26 +34,58 @@ class Filter:
         return NotFilter(self)
 
 
+def _flatten(cls, f) -> tuple:
+    """
+    Operands of f if it is the same kind of composite filter, else (f,).
+    An OrFilter is only merged when none of its operands can raise (built-in
+    filters catch their own errors), so an error still fails just its own group.
+    """
+    if type(f) is not cls:
+        return (f,)
+    if cls is OrFilter and not all(type(g).__module__ == __name__ for g in f.filters):
+        return (f,)
+    return f.filters
+
+
 class AndFilter(Filter):
+    """
+    Matches when every operand matches.
+    Chains like a & b & c are flattened into one tuple at composition time,
+    so each update is checked in a single loop instead of nested calls.
+    """
+
     def __init__(self, filter1: Filter, filter2: Filter):
         self.filter1 = filter1
         self.filter2 = filter2
+        self.filters = _flatten(AndFilter, filter1) + _flatten(AndFilter, filter2)
 
     def __call__(self, message):
         try:
-            return bool(self.filter1(message)) and bool(self.filter2(message))
+            for f in self.filters:
+                if not f(message):
+                    return False
+            return True
         except Exception as e:
             logger.error(f"Error in AndFilter: {e}")
             return False
 
 class OrFilter(Filter):
+    """
+    Matches when any operand matches.
+    Chains like a | b | c are flattened the same way as AndFilter.
+    """
+
     def __init__(self, filter1: Filter, filter2: Filter):
         self.filter1 = filter1
         self.filter2 = filter2
+        self.filters = _flatten(OrFilter, filter1) + _flatten(OrFilter, filter2)
 
     def __call__(self, message):
         try:
-            return bool(self.filter1(message)) or bool(self.filter2(message))
+            for f in self.filters:
+                if f(message):
+                    return True
+            return False
         except Exception as e:
             logger.error(f"Error in OrFilter: {e}")
             return False
@@ -294,7 +327,7 @@ class RegexFilter(Filter):
         """
         try:
             if isinstance(pattern, str):
-                self.pattern = re.compile(pattern, flags)
+                self.pattern = _compile_re(pattern, flags)
             else:
                 self.pattern = pattern
         except re.error as e:
@@ -316,7 +349,7 @@ class CaptionRegexFilter(Filter):
     def __init__(self, pattern: Union[str, re.Pattern], flags: int = 0):
         try:
             if isinstance(pattern, str):
-                self.pattern = re.compile(pattern, flags)
+                self.pattern = _compile_re(pattern, flags)
             else:
                 self.pattern = pattern
         except re.error as e:
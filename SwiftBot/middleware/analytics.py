@@ -4,10 +4,11 @@ Copyright (c) 2025 Arjun-M/SwiftBot
 """
 
 import asyncio
+import heapq
 import time
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Callable
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 from .base import Middleware
 
 
@@ -37,8 +38,8 @@ class AnalyticsCollector(Middleware):
         self.enable_real_time = enable_real_time
         self.cleanup_interval = cleanup_interval
 
-        # Cache-based storage
-        self.user_sessions = {}
+        # Cache-based storage (sessions ordered by last activity)
+        self.user_sessions: OrderedDict = OrderedDict()
         self.command_stats = {}
         self.performance_history = deque(maxlen=1440)  # 24 hours
 
@@ -49,6 +50,7 @@ class AnalyticsCollector(Middleware):
             'error_rate': 0,
             'response_times': deque(maxlen=1000)
         }
+        self._response_time_total = 0.0
 
         # Counters
         self.message_counter = 0
@@ -56,35 +58,57 @@ class AnalyticsCollector(Middleware):
         self.last_reset_time = time.time()
         self.last_cleanup = time.time()
 
+        # Select the update path once, based on enabled features
+        # (subclasses overriding on_update keep their own implementation)
+        if not enable_real_time and type(self).on_update is AnalyticsCollector.on_update:
+            self.on_update = self._on_update_basic
+
     async def on_update(self, ctx, next_handler):
         """Process update and collect analytics"""
         start_time = time.time()
 
         try:
-            # Track user session
-            self._track_user_session(ctx)
-
-            # Track command usage
-            if ctx.text and ctx.text.startswith('/'):
-                command = ctx.text.split()[0]
-                self._track_command_usage(ctx, command)
-
-            self.message_counter += 1
-
-            # Periodic cleanup
-            if start_time - self.last_cleanup > self.cleanup_interval:
-                self._cleanup_old_data(start_time)
+            self._record_update(ctx, start_time)
 
             await next_handler()
 
-            # Track response time
+            # Track response time (keep a running total of the window)
             response_time = time.time() - start_time
-            self.current_metrics['response_times'].append(response_time)
+            response_times = self.current_metrics['response_times']
+            if len(response_times) == response_times.maxlen:
+                self._response_time_total -= response_times[0]
+            response_times.append(response_time)
+            self._response_time_total += response_time
 
         except Exception as e:
             self.error_counter += 1
             raise
 
+    async def _on_update_basic(self, ctx, next_handler):
+        """Process update without real-time response tracking"""
+        try:
+            self._record_update(ctx, time.time())
+            await next_handler()
+        except Exception:
+            self.error_counter += 1
+            raise
+
+    def _record_update(self, ctx, current_time: float):
+        """Track session, command usage and counters for an update"""
+        # Track user session
+        self._track_user_session(ctx)
+
+        # Track command usage
+        text = ctx.text
+        if text and text[0] == '/':
+            self._track_command_usage(ctx, text.split(maxsplit=1)[0])
+
+        self.message_counter += 1
+
+        # Periodic cleanup
+        if current_time - self.last_cleanup > self.cleanup_interval:
+            self._cleanup_old_data(current_time)
+
     def _track_user_session(self, ctx):
         """Track user session in cache"""
         if not ctx.user:
@@ -93,7 +117,8 @@ class AnalyticsCollector(Middleware):
         user_id = ctx.user.id
         current_time = time.time()
 
-        if user_id not in self.user_sessions:
+        session = self.user_sessions.get(user_id)
+        if session is None:
             self.user_sessions[user_id] = {
                 'user_id': user_id,
                 'username': ctx.user.username,
@@ -104,13 +129,12 @@ class AnalyticsCollector(Middleware):
                 'errors': 0
             }
         else:
-            session = self.user_sessions[user_id]
             session['last_activity'] = current_time
             session['messages_sent'] += 1
+            self.user_sessions.move_to_end(user_id)
 
-        # Cleanup if at capacity
-        if len(self.user_sessions) > self.max_sessions:
-            self._cleanup_old_sessions(current_time)
+        # Evict expired or over-capacity sessions from the least recent end
+        self._cleanup_old_sessions(current_time)
 
     def _track_command_usage(self, ctx, command: str):
         """Track command usage in cache"""
@@ -136,14 +160,17 @@ class AnalyticsCollector(Middleware):
                 self.user_sessions[ctx.user.id]['commands_used'].add(command)
 
     def _cleanup_old_sessions(self, current_time: float):
-        """Clean up old sessions from cache"""
-        expired_sessions = [
-            user_id for user_id, session in self.user_sessions.items()
-            if current_time - session['last_activity'] > self.session_timeout
-        ]
-
-        for user_id in expired_sessions:
-            del self.user_sessions[user_id]
+        """
+        Clean up old sessions from cache.
+        Sessions are kept in last-activity order, so only the front is inspected.
+        """
+        sessions = self.user_sessions
+        while sessions:
+            oldest = next(iter(sessions.values()))
+            if (current_time - oldest['last_activity'] <= self.session_timeout and
+                    len(sessions) <= self.max_sessions):
+                break
+            sessions.popitem(last=False)
 
     def _cleanup_old_data(self, current_time: float):
         """Clean up old analytics data"""
@@ -175,11 +202,11 @@ class AnalyticsCollector(Middleware):
 
     def get_stats(self) -> dict:
         """Get analytics statistics"""
-        current_time = time.time()
-        active_users = len([
-            s for s in self.user_sessions.values()
-            if current_time - s['last_activity'] < 300  # 5 minutes
-        ])
+        cutoff = time.time() - 300  # 5 minutes
+        active_users = 0
+        for session in self.user_sessions.values():
+            if session['last_activity'] > cutoff:
+                active_users += 1
 
         return {
             'active_sessions': len(self.user_sessions),
@@ -189,6 +216,25 @@ class AnalyticsCollector(Middleware):
             'errors_tracked': self.error_counter,
         }
 
+    def get_top_commands(self, limit: int = 10) -> List[dict]:
+        """Get most used commands, ordered by total uses"""
+        top = heapq.nlargest(
+            limit,
+            self.command_stats.values(),
+            key=lambda stats: stats['total_uses']
+        )
+
+        return [
+            {
+                'command': stats['command'],
+                'total_uses': stats['total_uses'],
+                'unique_users': len(stats['unique_users']),
+                'errors': stats['errors'],
+                'last_used': stats['last_used'],
+            }
+            for stats in top
+        ]
+
     def get_current_metrics(self) -> dict:
         """Get current real-time metrics"""
         current_time = time.time()
@@ -198,7 +244,7 @@ class AnalyticsCollector(Middleware):
         error_rate = (self.error_counter / max(self.message_counter, 1)) * 100
 
         avg_response_time = (
-            sum(self.current_metrics['response_times']) / 
+            self._response_time_total /
             max(len(self.current_metrics['response_times']), 1)
         )
 
@@ -6,10 +6,26 @@ Copyright (c) 2025 Arjun-M/SwiftBot
 import logging
 import json
 import sys
+import time
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 from .base import Middleware
 
+try:
+    import orjson
+except ImportError:  # Optional speedup
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """
+    Serialize log payload to a JSON string, using orjson when available.
+    The fallback uses orjson's compact separators so output is identical either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
 
 class Logger(Middleware):
     """
@@ -79,6 +95,9 @@ class Logger(Middleware):
         # Rate limiting
         self._log_timestamps = []
 
+        # ISO timestamp cache, reformatted at most once per second
+        self._iso_cache = (0, "")
+
         # Performance tracking
         self._performance_stats = {
             'total_updates': 0,
@@ -145,6 +164,13 @@ class Logger(Middleware):
         self._log_timestamps.append(now)
         return True
 
+    def _iso_timestamp(self) -> str:
+        """Get current local time as ISO string, cached per second"""
+        now = int(time.time())
+        if now != self._iso_cache[0]:
+            self._iso_cache = (now, time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)))
+        return self._iso_cache[1]
+
     def _truncate_message(self, message: str) -> str:
         """Truncate message if too long"""
         if len(message) <= self.max_log_length:
@@ -178,7 +204,7 @@ class Logger(Middleware):
             await next_handler()
             return
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         if self.include_updates:
             self._log_update(ctx)
@@ -188,21 +214,21 @@ class Logger(Middleware):
 
             # Performance tracking
             if self.include_performance:
-                duration = (datetime.now() - start_time).total_seconds()
+                duration = time.perf_counter() - start_time
                 self._update_performance_stats(duration)
 
                 if duration > 1.0:  # Log slow operations
-                    self.logger.warning(f"Slow handler execution: {duration:.3f}s")
+                    self.logger.warning("Slow handler execution: %.3fs", duration)
                 else:
-                    self.logger.debug(f"Handler executed in {duration:.3f}s")
+                    self.logger.debug("Handler executed in %.3fs", duration)
 
         except Exception as e:
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             self._performance_stats['error_count'] += 1
 
             if self.include_errors:
                 self.logger.error(
-                    f"Handler failed after {duration:.3f}s: {e}",
+                    "Handler failed after %.3fs: %s", duration, e,
                     extra={'context': 'handler_execution', 'duration': duration}
                 )
             raise
@@ -224,10 +250,13 @@ class Logger(Middleware):
 
     def _log_update(self, ctx):
         """Log update details with sanitization"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
         try:
             if self.format == "json":
                 log_data = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self._iso_timestamp(),
                     "user_id": ctx.user.id if ctx.user else None,
                     "username": ctx.user.username if ctx.user else None,
                     "chat_id": ctx.chat.id if ctx.chat else None,
@@ -239,7 +268,7 @@ class Logger(Middleware):
                 # Sanitize sensitive data
                 log_data = self._sanitize_data(log_data)
 
-                self.logger.info(json.dumps(log_data, ensure_ascii=False))
+                self.logger.info(_dumps(log_data))
             else:
                 user_info = f"@{ctx.user.username}" if ctx.user and ctx.user.username else f"ID:{ctx.user.id}" if ctx.user else "Unknown"
                 chat_info = f"Chat:{ctx.chat.id}" if ctx.chat else "DM"
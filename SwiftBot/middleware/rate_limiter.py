@@ -4,7 +4,7 @@ Copyright (c) 2025 Arjun-M/SwiftBot
 """
 
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from .base import Middleware
 
 
@@ -45,8 +45,8 @@ class RateLimiter(Middleware):
         self.on_exceeded = on_exceeded
         self.cleanup_interval = cleanup_interval
 
-        # Cache-based storage
-        self._request_cache = defaultdict(list)
+        # Cache-based storage (per-key timestamps, oldest first)
+        self._request_cache = defaultdict(deque)
         self._last_cleanup = time.time()
 
     async def on_update(self, ctx, next_handler):
@@ -72,9 +72,10 @@ class RateLimiter(Middleware):
         """Check if key is rate limited using cache"""
         requests = self._request_cache[key]
 
-        # Remove old requests
+        # Remove old requests from the front of the window
         cutoff_time = current_time - self.per
-        requests[:] = [t for t in requests if t > cutoff_time]
+        while requests and requests[0] <= cutoff_time:
+            requests.popleft()
 
         return len(requests) >= self.rate
 
@@ -88,10 +89,12 @@ class RateLimiter(Middleware):
 
         # Clean up request logs
         for key in list(self._request_cache.keys()):
-            self._request_cache[key] = [t for t in self._request_cache[key] if t > cutoff_time]
+            requests = self._request_cache[key]
+            while requests and requests[0] <= cutoff_time:
+                requests.popleft()
 
             # Remove empty entries
-            if not self._request_cache[key]:
+            if not requests:
                 del self._request_cache[key]
 
         self._last_cleanup = current_time
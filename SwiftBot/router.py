@@ -1,25 +1,54 @@
 """
-High-performance command routing with Trie data structure
-Provides O(m) lookup time where m = command length
+High-performance command routing with an indexed command table
+Exact commands resolve in one dict lookup; a Trie serves prefix queries
 Copyright (c) 2025 Arjun-M/SwiftBot
 """
 
 import re
+import sys
+import bisect
 import logging
 from typing import Dict, List, Callable, Optional, Any, Tuple
 from collections import defaultdict
-from functools import lru_cache
+from .utils import _compile_re
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
 
+# Interned event type names, compared by identity in add_handler
+_MESSAGE = sys.intern("Message")
+_CALLBACK_QUERY = sys.intern("CallbackQuery")
+_INLINE_QUERY = sys.intern("InlineQuery")
+_EDITED_MESSAGE = sys.intern("EditedMessage")
+
+# Update type -> event type class name for handlers kept in other_handlers
+_OTHER_EVENT_NAMES = {
+    "my_chat_member": "ChatMemberUpdated",
+    "chat_member": "ChatMemberUpdated",
+    "poll_answer": "PollAnswer",
+    "pre_checkout_query": "PreCheckoutQuery",
+    "shipping_query": "ShippingQuery",
+    "chosen_inline_result": "ChosenInlineResult",
+}
+
+# Command part of a message: leading "/" up to whitespace or "@botname"
+_CMD_RE = re.compile(r'\s*(/[^\s@]*)')
+
+
+def _priority_key(handler_tuple: Tuple) -> int:
+    """Sort key placing higher priority handlers first"""
+    return -handler_tuple[2]
+
+
 class TrieNode:
     """
     Node in the command Trie for fast prefix matching.
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
 
+    __slots__ = ('children', 'handler', 'event_type', 'is_end', 'priority')
+
     def __init__(self):
         self.children: Dict[str, TrieNode] = {}
         self.handler: Optional[Callable] = None
@@ -30,16 +59,17 @@ class TrieNode:
 
 class CommandTrie:
     """
-    Trie data structure for O(m) command lookup.
-    Dramatically faster than linear search for large command sets.
+    Command index: a flat dict for exact lookups plus a Trie for prefix queries.
+    Exact lookups are a single hash probe; the Trie serves listing and autocomplete.
 
-    Performance: O(m) where m = command length vs O(n*m) for linear search
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
 
     def __init__(self):
         self.root = TrieNode()
         self.command_count = 0
+        # Flat index of complete commands, used for all exact lookups
+        self._exact: Dict[str, Tuple[Callable, Any]] = {}
 
     def insert(self, command: str, handler: Callable, event_type: Any, priority: int = 0):
         """
@@ -64,11 +94,24 @@ class CommandTrie:
         node.handler = handler
         node.event_type = event_type
         node.priority = priority
+        self._exact[command] = (handler, event_type)
         self.command_count += 1
 
+    def get(self, command: str) -> Optional[Tuple[Callable, Any]]:
+        """
+        Look up an already normalized command (lowercase, no arguments or @botname).
+
+        Args:
+            command: Normalized command (e.g., "/start")
+
+        Returns:
+            Tuple of (handler, event_type) if found, None otherwise
+        """
+        return self._exact.get(command)
+
     def search(self, command: str) -> Optional[Tuple[Callable, Any]]:
         """
-        Search for command handler in O(m) time.
+        Search for command handler, normalizing raw message text first.
 
         Args:
             command: Command to search for (with or without arguments)
@@ -79,18 +122,24 @@ class CommandTrie:
         # Extract just the command part (before first space and @)
         command_part = command.split()[0].split('@')[0].lower()
 
-        node = self.root
-        for char in command_part:
-            if char not in node.children:
-                return None
-            node = node.children[char]
+        return self.get(command_part)
 
-        if node.is_end:
-            return (node.handler, node.event_type)
-        return None
+    def prefix_search(self, prefix: str) -> List[str]:
+        """
+        Get all registered commands starting with prefix (e.g., for autocomplete).
+
+        Args:
+            prefix: Command prefix (e.g., "/st")
+
+        Returns:
+            List of matching commands
+        """
+        node = self.root
+        for char in prefix.lower():
+            node = node.children.get(char)
+            if node is None:
+                return []
 
-    def get_all_commands(self) -> List[str]:
-        """Get all registered commands for debugging"""
         commands = []
 
         def traverse(node: TrieNode, prefix: str):
@@ -99,17 +148,21 @@ class CommandTrie:
             for char, child in node.children.items():
                 traverse(child, prefix + char)
 
-        traverse(self.root, "")
+        traverse(node, prefix.lower())
         return commands
 
+    def get_all_commands(self) -> List[str]:
+        """Get all registered commands for debugging"""
+        return self.prefix_search("")
+
 
 class CommandRouter:
     """
-    High-performance router with Trie-based command routing.
+    High-performance router with indexed command routing.
     Provides 30× faster routing compared to linear pattern matching.
 
     Features:
-    - O(m) command lookup with Trie
+    - O(1) exact command lookup via CommandTrie's flat index
     - Pre-compiled regex patterns with LRU cache
     - Priority-based handler execution
     - Comprehensive error handling
@@ -126,13 +179,25 @@ class CommandRouter:
         self.edited_message_handlers: List[Tuple] = []
         self.other_handlers: Dict[str, List[Tuple]] = defaultdict(list)
 
-        # Performance optimizations
-        self._compiled_patterns_cache: Dict[str, re.Pattern] = {}
+        # Update type -> handler list, replaces per-update if/elif dispatch
+        self._handlers_by_type: Dict[str, List[Tuple]] = {
+            "message": self.text_handlers,
+            "edited_message": self.edited_message_handlers,
+            "callback_query": self.callback_handlers,
+            "inline_query": self.inline_handlers,
+        }
+
+        # Update type -> compiled (matches, handler, event_type, priority, returns_match) entries,
+        # built lazily on first route and invalidated by add_handler
+        self._matchers: Dict[str, Tuple] = {}
+
+        # Total registered handlers, maintained at registration time
+        self.total_handlers = 0
+
+        # Performance statistics
         self._handler_stats = {
             'commands_processed': 0,
             'patterns_processed': 0,
-            'cache_hits': 0,
-            'cache_misses': 0
         }
 
     def add_handler(self, event_type, handler: Callable, priority: int = 0):
@@ -145,11 +210,12 @@ class CommandRouter:
             priority: Handler priority (higher = earlier execution)
         """
         try:
-            event_name = type(event_type).__name__
+            event_name = sys.intern(type(event_type).__name__)
             handler_tuple = (event_type, handler, priority)
+            self._matchers.clear()
 
-            # Command optimization: Use Trie for fast lookup
-            if event_name == "Message":
+            # Command optimization: index plain commands for exact lookup
+            if event_name is _MESSAGE:
                 # Check if it's a simple command (starts with /)
                 if (hasattr(event_type, 'text') and 
                     event_type.text and 
@@ -160,53 +226,32 @@ class CommandRouter:
                     not event_type.filters):     # No additional filters
 
                     self.command_trie.insert(event_type.text, handler, event_type, priority)
-                    logger.debug(f"Added command to Trie: {event_type.text}")
+                    self.total_handlers += 1
+                    logger.debug(f"Added command to index: {event_type.text}")
                     return
 
                 # Otherwise add to text handlers
-                self.text_handlers.append(handler_tuple)
-                self.text_handlers.sort(key=lambda x: x[2], reverse=True)
+                bisect.insort(self.text_handlers, handler_tuple, key=_priority_key)
 
-            elif event_name == "CallbackQuery":
-                self.callback_handlers.append(handler_tuple)
-                self.callback_handlers.sort(key=lambda x: x[2], reverse=True)
+            elif event_name is _CALLBACK_QUERY:
+                bisect.insort(self.callback_handlers, handler_tuple, key=_priority_key)
 
-            elif event_name == "InlineQuery":
-                self.inline_handlers.append(handler_tuple)
-                self.inline_handlers.sort(key=lambda x: x[2], reverse=True)
+            elif event_name is _INLINE_QUERY:
+                bisect.insort(self.inline_handlers, handler_tuple, key=_priority_key)
 
-            elif event_name == "EditedMessage":
-                self.edited_message_handlers.append(handler_tuple)
-                self.edited_message_handlers.sort(key=lambda x: x[2], reverse=True)
+            elif event_name is _EDITED_MESSAGE:
+                bisect.insort(self.edited_message_handlers, handler_tuple, key=_priority_key)
 
             else:
-                self.other_handlers[event_name].append(handler_tuple)
-                self.other_handlers[event_name].sort(key=lambda x: x[2], reverse=True)
+                bisect.insort(self.other_handlers[event_name], handler_tuple, key=_priority_key)
 
+            self.total_handlers += 1
             logger.debug(f"Added {event_name} handler with priority {priority}")
 
         except Exception as e:
             logger.error(f"Error adding handler: {e}")
             raise
 
-    @lru_cache(maxsize=1000)
-    def _get_compiled_pattern(self, pattern_str: str) -> re.Pattern:
-        """
-        Get compiled regex pattern with LRU caching.
-        Avoids recompiling frequently used patterns.
-        """
-        try:
-            if pattern_str not in self._compiled_patterns_cache:
-                self._compiled_patterns_cache[pattern_str] = re.compile(pattern_str)
-                self._handler_stats['cache_misses'] += 1
-            else:
-                self._handler_stats['cache_hits'] += 1
-
-            return self._compiled_patterns_cache[pattern_str]
-        except re.error as e:
-            logger.error(f"Invalid regex pattern '{pattern_str}': {e}")
-            raise
-
     async def route(self, update_obj: Any, update_type: str) -> Tuple[Optional[Callable], Optional[re.Match], Optional[Any]]:
         """
         Route update to appropriate handler with optimal performance.
@@ -219,39 +264,34 @@ class CommandRouter:
             Tuple of (handler, match_object, event_type) if found, (None, None, None) otherwise
         """
         try:
-            # Fast path: Command lookup with Trie (O(m))
-            if update_type == "message" and hasattr(update_obj, 'text') and update_obj.text:
-                text = update_obj.text.strip()
-                if text.startswith('/'):
-                    result = self.command_trie.search(text)
-                    if result:
-                        handler, event_type = result
-                        self._handler_stats['commands_processed'] += 1
-                        logger.debug(f"Trie matched command: {text}")
-                        return handler, None, event_type
-
-            # Determine handler list based on update type
+            # Fast path: Command lookup
             if update_type == "message":
-                handlers = self.text_handlers
-            elif update_type == "edited_message":
-                handlers = self.edited_message_handlers
-            elif update_type == "callback_query":
-                handlers = self.callback_handlers
-            elif update_type == "inline_query":
-                handlers = self.inline_handlers
-            else:
-                handlers = self.other_handlers.get(update_type, [])
+                text = getattr(update_obj, 'text', None)
+                if text:
+                    command = _CMD_RE.match(text)
+                    if command:
+                        result = self.command_trie.get(command.group(1).lower())
+                        if result:
+                            handler, event_type = result
+                            self._handler_stats['commands_processed'] += 1
+                            logger.debug("Matched command: %s", text)
+                            return handler, None, event_type
+
+            # Determine compiled handler list based on update type
+            matchers = self._matchers.get(update_type)
+            if matchers is None:
+                matchers = self._compile_matchers(update_type)
 
             # Match against handlers in priority order
-            for event_type, handler, priority in handlers:
+            for matches, handler, event_type, priority, returns_match in matchers:
                 try:
-                    match_result = event_type.matches(update_obj)
+                    match_result = matches(update_obj)
                     if match_result:
                         self._handler_stats['patterns_processed'] += 1
 
-                        # Return match object if it's a regex match
-                        match_obj = match_result if isinstance(match_result, re.Match) else None
-                        logger.debug(f"Handler matched for {update_type} with priority {priority}")
+                        # Return match object if the event type can produce a regex match
+                        match_obj = match_result if returns_match and match_result is not True else None
+                        logger.debug("Handler matched for %s with priority %s", update_type, priority)
                         return handler, match_obj, event_type
 
                 except Exception as e:
@@ -259,13 +299,31 @@ class CommandRouter:
                     continue
 
             # No handler found
-            logger.debug(f"No handler found for {update_type}")
+            logger.debug("No handler found for %s", update_type)
             return None, None, None
 
         except Exception as e:
             logger.error(f"Error in routing: {e}")
             return None, None, None
 
+    def _compile_matchers(self, update_type: str) -> Tuple:
+        """
+        Build the matcher tuple for an update type.
+        Binds each event type's matches() once so routing skips attribute lookups.
+        """
+        handlers = self._handlers_by_type.get(update_type)
+        if handlers is None:
+            event_name = _OTHER_EVENT_NAMES.get(update_type, update_type)
+            handlers = self.other_handlers.get(event_name, ())
+
+        matchers = tuple(
+            (event_type.matches, handler, event_type, priority,
+             getattr(event_type, '_returns_match', False))
+            for event_type, handler, priority in handlers
+        )
+        self._matchers[update_type] = matchers
+        return matchers
+
     def get_handlers_count(self) -> Dict[str, int]:
         """
         Get count of registered handlers by type.
@@ -282,15 +340,19 @@ class CommandRouter:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get router performance statistics"""
+        cache_info = _compile_re.cache_info()
+        performance = self._handler_stats.copy()
+        performance['cache_hits'] = cache_info.hits
+        performance['cache_misses'] = cache_info.misses
+
         return {
             "handlers": self.get_handlers_count(),
-            "performance": self._handler_stats.copy(),
-            "cache_size": len(self._compiled_patterns_cache),
+            "performance": performance,
+            "cache_size": cache_info.currsize,
             "registered_commands": self.command_trie.get_all_commands()
         }
 
     def clear_cache(self):
         """Clear compiled pattern cache"""
-        self._compiled_patterns_cache.clear()
-        self._get_compiled_pattern.cache_clear()
+        _compile_re.cache_clear()
         logger.info("Router cache cleared")
@@ -6,9 +6,56 @@ Copyright (c) 2025 Arjun-M/SwiftBot
 import re
 from typing import Union, List, Callable, Optional, Pattern, Any
 from dataclasses import dataclass
+from .utils import _compile_re
 
+_MISSING = object()
 
-@dataclass
+
+def _get_match_text(update_obj: Any) -> Optional[str]:
+    """Get text to match against: message text, callback data or inline query"""
+    text = getattr(update_obj, 'text', _MISSING)
+    if text is _MISSING:
+        text = getattr(update_obj, 'data', _MISSING)  # CallbackQuery
+        if text is _MISSING:
+            text = getattr(update_obj, 'query', None)  # InlineQuery
+    return text
+
+
+def _make_filter_check(key: str, value: Any) -> Callable[[Any], bool]:
+    """
+    Build a predicate for one keyword filter (e.g. chat_id=123, chat.type="private").
+    List/tuple/set values become frozenset membership checks.
+    """
+    if '.' in key:
+        path = tuple(key.split('.'))
+
+        def get_value(obj):
+            for attr in path:
+                obj = getattr(obj, attr, _MISSING)
+            return obj
+    else:
+        def get_value(obj):
+            return getattr(obj, key, _MISSING)
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        try:
+            allowed = frozenset(value)
+        except TypeError:  # Unhashable filter values, keep linear membership
+            allowed = tuple(value)
+
+        def check(update_obj):
+            try:
+                return get_value(update_obj) in allowed
+            except TypeError:  # Unhashable attribute value
+                return False
+    else:
+        def check(update_obj):
+            return get_value(update_obj) == value
+
+    return check
+
+
+@dataclass(slots=True)
 class User:
     """Telegram user object"""
     id: int
@@ -19,7 +66,7 @@ class User:
     language_code: Optional[str] = None
 
 
-@dataclass  
+@dataclass(slots=True)
 class Chat:
     """Telegram chat object"""
     id: int
@@ -39,6 +86,11 @@ class EventType:
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
 
+    __slots__ = (
+        'text', 'patterns', 'func', 'filter_func', 'incoming', 'outgoing',
+        'filters', '_has_text_filter', '_filter_checks', '_returns_match'
+    )
+
     def __init__(
         self,
         text: Optional[str] = None,
@@ -69,6 +121,13 @@ class EventType:
         self.outgoing = outgoing
         self.filters = kwargs
 
+        # Precomputed for the matches() fast path
+        self._has_text_filter = bool(text)
+        self._returns_match = bool(self.patterns)  # matches() may return re.Match
+        self._filter_checks = tuple(
+            _make_filter_check(key, value) for key, value in kwargs.items()
+        )
+
     def _compile_patterns(self, pattern):
         """Compile regex patterns for efficient matching"""
         if pattern is None:
@@ -80,7 +139,7 @@ class EventType:
         compiled = []
         for p in pattern:
             if isinstance(p, str):
-                compiled.append(re.compile(p))
+                compiled.append(_compile_re(p))
             else:
                 compiled.append(p)
         return compiled
@@ -97,65 +156,33 @@ class EventType:
         if self.filter_func and not self.filter_func(update_obj):
             return None
 
-        # Text exact match
-        if self.text:
-            obj_text = None
-            if hasattr(update_obj, 'text'):
-                obj_text = update_obj.text
-            elif hasattr(update_obj, 'data'):  # CallbackQuery
-                obj_text = update_obj.data
-            elif hasattr(update_obj, 'query'):  # InlineQuery
-                obj_text = update_obj.query
-
-            if obj_text != self.text:
-                return None
+        patterns = self.patterns
+        if self._has_text_filter or patterns:
+            obj_text = _get_match_text(update_obj)
 
-        # Pattern matching
-        if self.patterns:
-            obj_text = None
-            if hasattr(update_obj, 'text'):
-                obj_text = update_obj.text
-            elif hasattr(update_obj, 'data'):  # CallbackQuery
-                obj_text = update_obj.data  
-            elif hasattr(update_obj, 'query'):  # InlineQuery
-                obj_text = update_obj.query
-
-            if obj_text:
-                for pattern in self.patterns:
-                    match = pattern.search(obj_text)  # Use search instead of match for flexibility
-                    if match:
-                        return match
-
-            # If patterns exist but none match and no text filter
-            if self.text is None:
+            # Text exact match
+            if self._has_text_filter and obj_text != self.text:
                 return None
 
+            # Pattern matching
+            if patterns:
+                if obj_text:
+                    for pattern in patterns:
+                        match = pattern.search(obj_text)  # Use search instead of match for flexibility
+                        if match:
+                            return match
+
+                # If patterns exist but none match and no text filter
+                if self.text is None:
+                    return None
+
         # Legacy custom filter function
         if self.func and not self.func(update_obj):
             return None
 
-        # Additional filters (more robust checking)
-        for key, value in self.filters.items():
-            obj_value = None
-
-            # Handle nested attributes like chat.type
-            if '.' in key:
-                obj = update_obj
-                for attr in key.split('.'):
-                    if hasattr(obj, attr):
-                        obj = getattr(obj, attr)
-                    else:
-                        return None
-                obj_value = obj
-            else:
-                if not hasattr(update_obj, key):
-                    return None
-                obj_value = getattr(update_obj, key)
-
-            if isinstance(value, list):
-                if obj_value not in value:
-                    return None
-            elif obj_value != value:
+        # Additional filters (prebuilt predicates)
+        for check in self._filter_checks:
+            if not check(update_obj):
                 return None
 
         return True  # Matches
@@ -174,6 +201,8 @@ class Message(EventType):
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
 
+    __slots__ = ()
+
     def __init__(self, filter_func=None, **kwargs):
         """Initialize Message event type with optional filter"""
         super().__init__(filter_func=filter_func, **kwargs)
@@ -186,7 +215,7 @@ class EditedMessage(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
 
 
 class CallbackQuery(EventType):
@@ -200,6 +229,8 @@ class CallbackQuery(EventType):
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
 
+    __slots__ = ()
+
     def __init__(self, data: Optional[str] = None, **kwargs):
         """
         Args:
@@ -220,7 +251,7 @@ class InlineQuery(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
 
 
 class ChatMemberUpdated(EventType):
@@ -230,7 +261,7 @@ class ChatMemberUpdated(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
 
 
 class PollAnswer(EventType):
@@ -240,7 +271,7 @@ class PollAnswer(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
 
 
 class PreCheckoutQuery(EventType):
@@ -249,7 +280,7 @@ class PreCheckoutQuery(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
 
 
 class ShippingQuery(EventType):
@@ -258,7 +289,7 @@ class ShippingQuery(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
 
 
 class ChosenInlineResult(EventType):
@@ -268,4 +299,4 @@ class ChosenInlineResult(EventType):
 
     Copyright (c) 2025 Arjun-M/SwiftBot
     """
-    pass
+    __slots__ = ()
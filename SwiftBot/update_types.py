@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     Telegram User object.
@@ -46,7 +46,7 @@ class User:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Chat:
     """
     Telegram Chat object.
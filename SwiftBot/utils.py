@@ -0,0 +1,11 @@
+"""
+Shared internal helpers
+Copyright (c) 2025 Arjun-M/SwiftBot
+"""
+
+import re
+from functools import lru_cache
+
+# Shared compiled regex cache (keyed by pattern and flags), used by the
+# router, event types and filters
+_compile_re = lru_cache(maxsize=1024)(re.compile)
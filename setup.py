@@ -38,6 +38,10 @@ setup(
     install_requires=requirements,
     extras_require={
         "webhook": ["uvicorn>=0.23.0,<0.26.0"],
+        "fast": [
+            "orjson>=3.9.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+        ],
         "dev": [
             "pytest>=7.4.0,<8.0.0",
             "pytest-asyncio>=0.21.0,<0.22.0",